@@ -153,6 +153,9 @@ def load_folder(
         print(f"The directory {file} is empty.")
         return
 
+    add_data_model_usecase = AddDataModel(sqlite_db=sqlite_db, monetdb=monetdb)
+    validate_dataset_usecase = ValidateDataset(sqlite_db=sqlite_db, monetdb=monetdb)
+    import_csv_usecase = ImportCSV(sqlite_db=sqlite_db, monetdb=monetdb)
     for subdir, dirs, files in os.walk(file):
         if dirs:
             continue
@@ -162,17 +165,15 @@ def load_folder(
         data_model_metadata = reader.read()
         code = data_model_metadata["code"]
         version = data_model_metadata["version"]
-        AddDataModel(sqlite_db=sqlite_db, monetdb=monetdb).execute(data_model_metadata)
+        add_data_model_usecase.execute(data_model_metadata)
         print(f"Data model '{code}' was successfully added.")
 
         for csv_path in glob.glob(subdir + "/*.csv"):
             print(f"CSV '{csv_path}' is being loaded...")
-            ValidateDataset(sqlite_db=sqlite_db, monetdb=monetdb).execute(
-                csv_path, copy_from_file, code, version
-            )
-            ImportCSV(sqlite_db=sqlite_db, monetdb=monetdb).execute(
+            cdes = validate_dataset_usecase.execute(
                 csv_path, copy_from_file, code, version
             )
+            import_csv_usecase.execute(csv_path, copy_from_file, code, version, cdes)
             print(f"CSV '{csv_path}' was successfully added.")
 
 
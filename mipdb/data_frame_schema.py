@@ -3,6 +3,8 @@ import pandera as pa
 
 from mipdb.exceptions import InvalidDatasetError
 
+SQLTYPE2PATYPE = {"text": pa.String, "int": pd.Int64Dtype(), "real": pa.Float}
+
 
 class DataFrameSchema:
     _schema: pa.DataFrameSchema
@@ -46,9 +48,7 @@ class DataFrameSchema:
         return self._schema
 
     def _pa_type_from_sql_type(self, sql_type):
-        return {"text": pa.String, "int": pd.Int64Dtype(), "real": pa.Float}.get(
-            sql_type
-        )
+        return SQLTYPE2PATYPE.get(sql_type)
 
     def _get_pa_checks(self, cdes_with_min_max, cdes_with_enumerations, column):
         checks = []
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import toml
 
@@ -6,8 +7,9 @@ CONFIG_PATH = "/home/config.toml"
 
 
 def credentials_from_config():
+    config_path = os.getenv("CONFIG_PATH", CONFIG_PATH)
     try:
-        return toml.load(os.getenv("CONFIG_PATH", CONFIG_PATH))
+        return dict(_load_config(config_path, os.path.getmtime(config_path)))
     except FileNotFoundError:
         return {
             "DB_IP": "",
@@ -20,3 +22,10 @@ def credentials_from_config():
             "DB_NAME": "",
             "SQLITE_DB_PATH": "",
         }
+
+
+# Every CLI option with a config default reads the credentials, so the file is
+# parsed once per path and modification time.
+@lru_cache(maxsize=4)
+def _load_config(config_path, mtime):
+    return toml.load(config_path)
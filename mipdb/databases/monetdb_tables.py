@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import json
 from enum import Enum
 from typing import List
 
@@ -93,9 +92,7 @@ class PrimaryDataTable(Table):
         cls, schema: Schema, cdes: List[CommonDataElement]
     ) -> "PrimaryDataTable":
         columns = [
-            sql.Column(
-                cde.code, STR2SQLTYPE[json.loads(cde.metadata)["sql_type"]], quote=True
-            )
+            sql.Column(cde.code, STR2SQLTYPE[cde.metadata_dict["sql_type"]], quote=True)
             for cde in cdes
         ]
         columns.insert(
@@ -1,11 +1,11 @@
-from typing import List, Any, Dict
+from typing import Any, Callable, Dict, List, Set, Tuple
 from enum import Enum
 
 import sqlalchemy as sql
 from sqlalchemy import MetaData, ForeignKey, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.orm.exc import MultipleResultsFound
+from sqlalchemy.util import LRUCache
 
 from mipdb.exceptions import DataBaseError
 
@@ -44,6 +44,8 @@ def handle_errors(func):
     return wrapper
 
 
+# The ids are plain INTEGER PRIMARY KEY rowid aliases (no SQLite AUTOINCREMENT),
+# so SQLite assigns them on insert but may reuse the ids of deleted rows.
 class DataModel(Base):
     __tablename__ = "data_models"
     data_model_id = sql.Column(sql.Integer, primary_key=True, autoincrement=True)
@@ -56,6 +58,9 @@ class DataModel(Base):
 
 class Dataset(Base):
     __tablename__ = "datasets"
+    __table_args__ = (
+        sql.Index("ix_datasets_data_model_id_code", "data_model_id", "code"),
+    )
     dataset_id = sql.Column(sql.Integer, primary_key=True, autoincrement=True)
     data_model_id = sql.Column(
         sql.Integer, ForeignKey("data_models.data_model_id"), nullable=False
@@ -67,11 +72,108 @@ class Dataset(Base):
     properties = sql.Column(sql.JSON, nullable=True)
 
 
+# The lookups below are issued by almost every use case. Building them once and
+# executing them through a shared compiled cache avoids recompiling the same SQL
+# on every call. The cache is bounded since ad-hoc statements end up in it too.
+_COMPILED_CACHE = LRUCache(500)
+
+_SELECT_DATA_MODEL_ID = sql.select([DataModel.data_model_id]).where(
+    sql.and_(
+        DataModel.code == sql.bindparam("code"),
+        DataModel.version == sql.bindparam("version"),
+    )
+)
+_SELECT_DATASET_ID = sql.select([Dataset.dataset_id]).where(
+    sql.and_(
+        Dataset.code == sql.bindparam("code"),
+        Dataset.data_model_id == sql.bindparam("data_model_id"),
+    )
+)
+# The status updates only match rows whose status differs, so the rowcount
+# tells whether anything changed without reading the status first.
+_UPDATE_DATA_MODEL_STATUS = (
+    DataModel.__table__.update()
+    .where(
+        sql.and_(
+            DataModel.code == sql.bindparam("data_model_code"),
+            DataModel.version == sql.bindparam("data_model_version"),
+            DataModel.status != sql.bindparam("new_status"),
+        )
+    )
+    .values(status=sql.bindparam("new_status"))
+)
+_UPDATE_DATASET_STATUS = (
+    Dataset.__table__.update()
+    .where(
+        sql.and_(
+            Dataset.code == sql.bindparam("dataset_code"),
+            Dataset.data_model_id.in_(
+                sql.select([DataModel.data_model_id]).where(
+                    sql.and_(
+                        DataModel.code == sql.bindparam("data_model_code"),
+                        DataModel.version == sql.bindparam("data_model_version"),
+                    )
+                )
+            ),
+            Dataset.status != sql.bindparam("new_status"),
+        )
+    )
+    .values(status=sql.bindparam("new_status"))
+)
+_SELECT_DATA_MODEL_PROPERTIES = sql.select([DataModel.properties]).where(
+    DataModel.data_model_id == sql.bindparam("data_model_id")
+)
+_SELECT_DATASET_PROPERTIES = sql.select([Dataset.properties]).where(
+    Dataset.dataset_id == sql.bindparam("dataset_id")
+)
+_UPDATE_DATA_MODEL_PROPERTIES = (
+    DataModel.__table__.update()
+    .where(DataModel.data_model_id == sql.bindparam("id"))
+    .values(properties=sql.bindparam("new_properties"))
+)
+_UPDATE_DATASET_PROPERTIES = (
+    Dataset.__table__.update()
+    .where(Dataset.dataset_id == sql.bindparam("id"))
+    .values(properties=sql.bindparam("new_properties"))
+)
+_SELECT_DATASET_AND_DATA_MODEL_ID = (
+    sql.select([Dataset.dataset_id, Dataset.data_model_id])
+    .select_from(Dataset.__table__.join(DataModel.__table__))
+    .where(
+        sql.and_(
+            Dataset.code == sql.bindparam("code"),
+            DataModel.code == sql.bindparam("data_model_code"),
+            DataModel.version == sql.bindparam("data_model_version"),
+        )
+    )
+)
+_SELECT_DATASETS_WITH_DATA_MODEL_FULLNAME = (
+    sql.select(
+        [
+            Dataset.dataset_id,
+            Dataset.data_model_id,
+            Dataset.code,
+            Dataset.label,
+            Dataset.status,
+            (DataModel.code + ":" + DataModel.version).label("data_model_fullname"),
+        ]
+    )
+    .select_from(Dataset.__table__.join(DataModel.__table__))
+    .order_by(Dataset.dataset_id)
+)
+# Insert statements are built once per table so that they hit the compiled cache.
+_INSERT_STATEMENTS = {}
+# Delete statements likewise, per table and filtered columns.
+_DELETE_STATEMENTS = {}
+
+
 class SQLiteDB:
     """Class representing a SQLite database interface."""
 
     def __init__(self, url: str, echo=False) -> None:
-        self._executor = sql.create_engine(url, echo=echo)
+        self._executor = sql.create_engine(
+            url, echo=echo, execution_options={"compiled_cache": _COMPILED_CACHE}
+        )
         self.Session = sessionmaker(bind=self._executor, autocommit=True)
 
     @classmethod
@@ -93,24 +195,14 @@ class SQLiteDB:
             return result.fetchall() if result else []
 
     def insert_values_to_table(self, table: sql.Table, values: List[dict]) -> None:
+        insert = _INSERT_STATEMENTS.get(table)
+        if insert is None:
+            insert = _INSERT_STATEMENTS[table] = table.insert()
         session = self.Session()
         try:
-            session.execute(table.insert(), values)
-        finally:
-            session.close()
-
-    def get_data_model_status(self, data_model_id: int) -> Any:
-        session = self.Session()
-        try:
-            query = session.query(DataModel.status).filter(
-                DataModel.data_model_id == data_model_id
-            )
-            result = query.one_or_none()
+            session.execute(insert, values)
         finally:
             session.close()
-        if result:
-            return result[0]
-        return None
 
     def update_data_model_status(self, status: str, data_model_id: int) -> None:
         session = self.Session()
@@ -122,29 +214,18 @@ class SQLiteDB:
         finally:
             session.close()
 
-    def get_dataset_status(self, dataset_id: int) -> Any:
-        session = self.Session()
-        try:
-            query = session.query(Dataset.status).filter(
-                Dataset.dataset_id == dataset_id
-            )
-            result = query.one_or_none()
-        finally:
-            session.close()
-        if result:
-            return result[0]
-        return None
-
     def get_metadata(self, data_model: str) -> dict:
-        session = self.Session()
-        try:
+        table_name = f"{data_model}_{METADATA_TABLE}"
+        table = Base.metadata.tables.get(table_name)
+        if table is None:
             table = sql.Table(
-                f"{data_model}_{METADATA_TABLE}",
+                table_name,
                 Base.metadata,
                 sql.Column("code", SQLTYPES.STRING, primary_key=True),
                 sql.Column("metadata", SQLTYPES.JSON),
-                extend_existing=True,
             )
+        session = self.Session()
+        try:
             query = session.query(table.c.code, table.c.metadata)
             res = query.all()
         finally:
@@ -224,6 +305,16 @@ class SQLiteDB:
             session.close()
         return result
 
+    def get_datasets_with_data_model_fullname(self) -> List[tuple]:
+        session = self.Session()
+        try:
+            result = session.execute(
+                _SELECT_DATASETS_WITH_DATA_MODEL_FULLNAME
+            ).fetchall()
+        finally:
+            session.close()
+        return result
+
     def get_row_count(self, table: str) -> int:
         session = self.Session()
         try:
@@ -243,24 +334,26 @@ class SQLiteDB:
             session.close()
 
     def delete_from(self, table, where_conditions: Dict[str, Any]) -> None:
+        key = (table, tuple(where_conditions))
+        delete = _DELETE_STATEMENTS.get(key)
+        if delete is None:
+            delete = _DELETE_STATEMENTS[key] = table.delete().where(
+                sql.and_(
+                    *[getattr(table.c, col) == sql.bindparam(col) for col in key[1]]
+                )
+            )
         session = self.Session()
         try:
-            query = session.query(table)
-            if where_conditions:
-                for col, value in where_conditions.items():
-                    query = query.filter(getattr(table.c, col) == value)
-
-            query.delete(synchronize_session=False)
+            session.execute(delete, where_conditions)
         finally:
             session.close()
 
     def get_dataset_properties(self, dataset_id: int) -> Any:
         session = self.Session()
         try:
-            query = session.query(Dataset.properties).filter(
-                Dataset.dataset_id == dataset_id
-            )
-            result = query.one_or_none()
+            result = session.execute(
+                _SELECT_DATASET_PROPERTIES, {"dataset_id": dataset_id}
+            ).first()
         finally:
             session.close()
 
@@ -269,10 +362,9 @@ class SQLiteDB:
     def get_data_model_properties(self, data_model_id: int) -> Any:
         session = self.Session()
         try:
-            query = session.query(DataModel.properties).filter(
-                DataModel.data_model_id == data_model_id
-            )
-            result = query.one_or_none()
+            result = session.execute(
+                _SELECT_DATA_MODEL_PROPERTIES, {"data_model_id": data_model_id}
+            ).first()
         finally:
             session.close()
 
@@ -298,20 +390,51 @@ class SQLiteDB:
         finally:
             session.close()
 
+    def update_data_model_properties(
+        self, data_model_id: int, update: Callable[[dict], dict]
+    ) -> None:
+        self._update_properties(
+            _SELECT_DATA_MODEL_PROPERTIES,
+            _UPDATE_DATA_MODEL_PROPERTIES,
+            {"data_model_id": data_model_id},
+            data_model_id,
+            update,
+        )
+
+    def update_dataset_properties(
+        self, dataset_id: int, update: Callable[[dict], dict]
+    ) -> None:
+        self._update_properties(
+            _SELECT_DATASET_PROPERTIES,
+            _UPDATE_DATASET_PROPERTIES,
+            {"dataset_id": dataset_id},
+            dataset_id,
+            update,
+        )
+
+    def _update_properties(self, select, update_statement, where, row_id, update):
+        # BEGIN IMMEDIATE takes the write lock before the read, so no other
+        # writer can change the properties between the read and the update.
+        with self._executor.begin() as conn:
+            conn.execute(sql.text("BEGIN IMMEDIATE"))
+            result = conn.execute(select, where).first()
+            properties = update(result[0] if result else {})
+            conn.execute(update_statement, {"id": row_id, "new_properties": properties})
+
     def get_data_model_id(self, code: str, version: str) -> int:
         session = self.Session()
         try:
-            query = session.query(DataModel.data_model_id).filter(
-                DataModel.code == code, DataModel.version == version
-            )
-            data_model_id = query.scalar()
-        except MultipleResultsFound:
-            raise DataBaseError(
-                f"Got more than one data_model ids for {code=} and {version=}."
-            )
+            result = session.execute(
+                _SELECT_DATA_MODEL_ID, {"code": code, "version": version}
+            ).fetchall()
         finally:
             session.close()
 
+        if len(result) > 1:
+            raise DataBaseError(
+                f"Got more than one data_model ids for {code=} and {version=}."
+            )
+        data_model_id = result[0][0] if result else None
         if not data_model_id:
             raise DataBaseError(
                 f"Data_models table doesn't have a record with {code=}, {version=}"
@@ -319,42 +442,104 @@ class SQLiteDB:
 
         return data_model_id
 
-    def get_max_data_model_id(self) -> int:
+    def get_dataset_id(self, code, data_model_id) -> int:
         session = self.Session()
         try:
-            result = session.query(sql.func.max(DataModel.data_model_id)).scalar()
+            result = session.execute(
+                _SELECT_DATASET_ID, {"code": code, "data_model_id": data_model_id}
+            ).fetchall()
         finally:
             session.close()
-        return result
 
-    def get_max_dataset_id(self) -> int:
+        if len(result) > 1:
+            raise DataBaseError(
+                f"Got more than one dataset ids for {code=} and {data_model_id=}."
+            )
+        dataset_id = result[0][0] if result else None
+        if not dataset_id:
+            raise DataBaseError(
+                f"Datasets table doesn't have a record with {code=}, {data_model_id=}"
+            )
+
+        return dataset_id
+
+    def get_existing_dataset_codes(self, data_model_id, codes) -> Set[str]:
         session = self.Session()
         try:
-            result = session.query(sql.func.max(Dataset.dataset_id)).scalar()
+            result = session.execute(
+                sql.select([Dataset.code]).where(
+                    sql.and_(
+                        Dataset.data_model_id == data_model_id,
+                        Dataset.code.in_(list(codes)),
+                    )
+                )
+            ).fetchall()
         finally:
             session.close()
-        return result
+        return {code for code, in result}
 
-    def get_dataset_id(self, code, data_model_id) -> int:
+    def get_dataset_and_data_model_id(
+        self, code, data_model_code, data_model_version
+    ) -> Tuple[int, int]:
         session = self.Session()
         try:
-            query = session.query(Dataset.dataset_id).filter(
-                Dataset.code == code, Dataset.data_model_id == data_model_id
-            )
-            dataset_id = query.scalar()
-        except MultipleResultsFound:
-            raise DataBaseError(
-                f"Got more than one dataset ids for {code=} and {data_model_id=}."
-            )
+            result = session.execute(
+                _SELECT_DATASET_AND_DATA_MODEL_ID,
+                {
+                    "code": code,
+                    "data_model_code": data_model_code,
+                    "data_model_version": data_model_version,
+                },
+            ).fetchall()
         finally:
             session.close()
 
-        if not dataset_id:
-            raise DataBaseError(
-                f"Datasets table doesn't have a record with {code=}, {data_model_id=}"
+        if len(result) == 1:
+            dataset_id, data_model_id = result[0]
+            return dataset_id, data_model_id
+
+        # Resolve the ids one by one so that the failing lookup raises its error.
+        data_model_id = self.get_data_model_id(data_model_code, data_model_version)
+        return self.get_dataset_id(code, data_model_id), data_model_id
+
+    def try_set_data_model_status(self, status: str, code, version) -> bool:
+        with self._executor.connect() as conn:
+            result = conn.execute(
+                _UPDATE_DATA_MODEL_STATUS,
+                {
+                    "data_model_code": code,
+                    "data_model_version": version,
+                    "new_status": status,
+                },
             )
+        if result.rowcount:
+            return True
 
-        return dataset_id
+        # Nothing changed, either the status is already set or the data model
+        # does not exist, in which case the id lookup raises the error.
+        self.get_data_model_id(code, version)
+        return False
+
+    def try_set_dataset_status(
+        self, status: str, code, data_model_code, data_model_version
+    ) -> bool:
+        with self._executor.connect() as conn:
+            result = conn.execute(
+                _UPDATE_DATASET_STATUS,
+                {
+                    "dataset_code": code,
+                    "data_model_code": data_model_code,
+                    "data_model_version": data_model_version,
+                    "new_status": status,
+                },
+            )
+        if result.rowcount:
+            return True
+
+        # Nothing changed, either the status is already set or the dataset
+        # does not exist, in which case the id lookups raise the error.
+        self.get_dataset_and_data_model_id(code, data_model_code, data_model_version)
+        return False
 
     def table_exists(self, table) -> bool:
         return table.exists(bind=self._executor)
@@ -362,6 +547,14 @@ class SQLiteDB:
     def create_table(self, table: sql.Table) -> None:
         table.create(bind=self._executor)
 
+    def create_missing_indexes(self, table: sql.Table) -> None:
+        existing_indexes = {
+            index["name"] for index in inspect(self._executor).get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(bind=self._executor)
+
     def get_all_tables(self) -> List[str]:
         inspector = inspect(self._executor)
         return inspector.get_table_names()
@@ -58,6 +58,9 @@ class Table(ABC):
     def exists(self, db):
         return db.table_exists(self._table)
 
+    def create_missing_indexes(self, db):
+        db.create_missing_indexes(self._table)
+
     def insert_values(self, values, db):
         db.insert_values_to_table(self._table, values)
 
@@ -98,8 +101,11 @@ class DataModelTable(Table):
     def set_data_model_properties(self, properties, data_model_id, db):
         db.set_data_model_properties(properties, data_model_id)
 
-    def get_data_model_status(self, data_model_id, db):
-        return db.get_data_model_status(data_model_id)
+    def update_data_model_properties(self, data_model_id, update, db):
+        db.update_data_model_properties(data_model_id, update)
+
+    def try_set_data_model_status(self, status, code, version, db):
+        return db.try_set_data_model_status(status, code, version)
 
     def set_data_model_status(self, status, data_model_id, db):
         db.update_data_model_status(status, data_model_id)
@@ -107,10 +113,6 @@ class DataModelTable(Table):
     def delete_data_model(self, code, version, db):
         db.delete_from(self._table, where_conditions={"code": code, "version": version})
 
-    def get_next_data_model_id(self, db):
-        result = db.get_max_data_model_id()
-        return result + 1 if result else 1
-
 
 class DatasetsTable(Table):
     def __init__(self):
@@ -119,6 +121,9 @@ class DatasetsTable(Table):
     def get_datasets(self, db, columns: list = None):
         return db.get_values(table=self._table, columns=columns, where_conditions={})
 
+    def get_datasets_with_data_model_fullname(self, db):
+        return db.get_datasets_with_data_model_fullname()
+
     def get_dataset_codes(self, db, data_model_id=None, columns=None):
         result = db.get_values(
             table=self._table,
@@ -140,18 +145,24 @@ class DatasetsTable(Table):
     def set_dataset_properties(self, properties, dataset_id, db):
         db.set_dataset_properties(properties, dataset_id)
 
+    def update_dataset_properties(self, dataset_id, update, db):
+        db.update_dataset_properties(dataset_id, update)
+
     def delete_dataset(self, dataset_id, data_model_id, db):
         db.delete_from(
             self._table,
             where_conditions={"dataset_id": dataset_id, "data_model_id": data_model_id},
         )
 
-    def get_next_dataset_id(self, db):
-        result = db.get_max_dataset_id()
-        return result + 1 if result else 1
+    def delete_datasets(self, data_model_id, db):
+        db.delete_from(self._table, where_conditions={"data_model_id": data_model_id})
 
-    def get_dataset_status(self, data_model_id, db):
-        return db.get_dataset_status(data_model_id)
+    def try_set_dataset_status(
+        self, status, code, data_model_code, data_model_version, db
+    ):
+        return db.try_set_dataset_status(
+            status, code, data_model_code, data_model_version
+        )
 
     def set_dataset_status(self, status, dataset_id, db):
         db.update_dataset_status(status, dataset_id)
@@ -159,17 +170,28 @@ class DatasetsTable(Table):
     def get_dataset_id(self, code, data_model_id, db):
         return db.get_dataset_id(code, data_model_id)
 
+    def get_existing_dataset_codes(self, data_model_id, codes, db):
+        return db.get_existing_dataset_codes(data_model_id, codes)
+
+    def get_dataset_and_data_model_id(
+        self, code, data_model_code, data_model_version, db
+    ):
+        return db.get_dataset_and_data_model_id(
+            code, data_model_code, data_model_version
+        )
+
 
 class MetadataTable(Table):
     def __init__(self, data_model):
         self.name = get_metadata_table_name(data_model)
-        self._table = sql.Table(
-            self.name,
-            Base.metadata,
-            sql.Column("code", SQLTYPES.STRING, primary_key=True),
-            sql.Column("metadata", SQLTYPES.JSON),
-            extend_existing=True,
-        )
+        self._table = Base.metadata.tables.get(self.name)
+        if self._table is None:
+            self._table = sql.Table(
+                self.name,
+                Base.metadata,
+                sql.Column("code", SQLTYPES.STRING, primary_key=True),
+                sql.Column("metadata", SQLTYPES.JSON),
+            )
 
     def set_table(self, table):
         self._table = table
@@ -1,8 +1,16 @@
 import json
 from dataclasses import dataclass
+from functools import cached_property
 
 from mipdb.exceptions import InvalidDataModelError, UserInputError
 
+METADATA_KEYS_TO_RENAME = {
+    "isCategorical": "is_categorical",
+    "minValue": "min",
+    "maxValue": "max",
+}
+VALID_METADATA_TYPES = ["nominal", "real", "integer", "text"]
+
 
 @dataclass
 class CommonDataElement:
@@ -23,9 +31,12 @@ class CommonDataElement:
             metadata,
         )
 
+    @cached_property
+    def metadata_dict(self):
+        return json.loads(self.metadata)
+
     def get_enumerations(self):
-        metadata = json.loads(self.metadata)
-        return metadata["enumerations"] if "enumerations" in metadata else []
+        return self.metadata_dict.get("enumerations", [])
 
 
 def flatten_cdes(schema_data):
@@ -45,7 +56,7 @@ def flatten_cdes(schema_data):
 
 
 def get_sql_type_per_column(cdes):
-    return {code: json.loads(cde.metadata)["sql_type"] for code, cde in cdes.items()}
+    return {code: cde.metadata_dict["sql_type"] for code, cde in cdes.items()}
 
 
 def get_cdes_with_min_max(cdes, columns):
@@ -53,7 +64,7 @@ def get_cdes_with_min_max(cdes, columns):
     for code, cde in cdes.items():
         if code not in columns:
             continue
-        metadata = json.loads(cde.metadata)
+        metadata = cde.metadata_dict
         max_value = metadata["max"] if "max" in metadata else None
         min_value = metadata["min"] if "min" in metadata else None
         if code in columns and min_value or max_value:
@@ -63,26 +74,21 @@ def get_cdes_with_min_max(cdes, columns):
 
 def get_cdes_with_enumerations(cdes, columns):
     return {
-        code: [
-            enum_code
-            for enum_code, enum_label in json.loads(cde.metadata)[
-                "enumerations"
-            ].items()
-        ]
+        code: list(cde.metadata_dict["enumerations"])
         for code, cde in cdes.items()
-        if json.loads(cde.metadata)["is_categorical"] and code in columns
+        if code in columns and cde.metadata_dict["is_categorical"]
     }
 
 
 def get_dataset_enums(cdes):
-    return json.loads(cdes["dataset"].metadata)["enumerations"]
+    return cdes["dataset"].metadata_dict["enumerations"]
 
 
 def validate_dataset_present_on_cdes_with_proper_format(cdes):
     dataset_cde = [cde for cde in cdes if cde.code == "dataset"]
     if not dataset_cde:
         raise InvalidDataModelError("There is no 'dataset' CDE in the data model.")
-    dataset_metadata = json.loads(dataset_cde[0].metadata)
+    dataset_metadata = dataset_cde[0].metadata_dict
     if not dataset_metadata["is_categorical"]:
         raise InvalidDataModelError(
             "CDE 'dataset' must have the 'isCategorical' property equal to 'true'."
@@ -99,9 +105,9 @@ def validate_longitudinal_data_model(cdes):
 
     for cde in cdes:
         if cde.code == "subjectid":
-            subject_id_metadata = json.loads(cde.metadata)
+            subject_id_metadata = cde.metadata_dict
         elif cde.code == "visitid":
-            visit_id_metadata = json.loads(cde.metadata)
+            visit_id_metadata = cde.metadata_dict
 
     if not subject_id_metadata:
         raise InvalidDataModelError(
@@ -131,12 +137,8 @@ def validate_visitid_cde(metadata):
 
 
 def reformat_metadata(metadata):
-    new_key_assign = {
-        "isCategorical": "is_categorical",
-        "minValue": "min",
-        "maxValue": "max",
-    }
-    for old_key, new_key in new_key_assign.items():
+    metadata = dict(metadata)
+    for old_key, new_key in METADATA_KEYS_TO_RENAME.items():
         if old_key in metadata:
             metadata[new_key] = metadata.pop(old_key)
 
@@ -161,9 +163,7 @@ def validate_metadata(code, metadata):
     if {"min", "max"} < set(metadata) and metadata["min"] >= metadata["max"]:
         raise InvalidDataModelError(f"The CDE {code} has min greater than the max.")
 
-    valid_metadata_types = ["nominal", "real", "integer", "text"]
-
-    if metadata["type"] not in valid_metadata_types:
+    if metadata["type"] not in VALID_METADATA_TYPES:
         raise InvalidDataModelError(
-            f"The CDE {code} has an 'type' the only valid types are:{valid_metadata_types} "
+            f"The CDE {code} has an 'type' the only valid types are:{VALID_METADATA_TYPES} "
         )
@@ -1,4 +1,3 @@
-import copy
 import os
 from abc import ABC, abstractmethod
 
@@ -30,6 +29,11 @@ from mipdb.data_frame import DataFrame, DATASET_COLUMN_NAME
 
 LONGITUDINAL = "longitudinal"
 
+# The metadata table wrappers hold no per-call state, so a single instance of
+# each is shared by all use cases.
+_DATA_MODEL_TABLE = DataModelTable()
+_DATASETS_TABLE = DatasetsTable()
+
 
 class UseCase(ABC):
     """Abstract use case class."""
@@ -40,7 +44,7 @@ class UseCase(ABC):
 
 
 def is_db_initialized(db: SQLiteDB):
-    if not (DataModelTable().exists(db) and DatasetsTable().exists(db)):
+    if not (_DATA_MODEL_TABLE.exists(db) and _DATASETS_TABLE.exists(db)):
         raise UserInputError("You need to initialize the database!\nTry mipdb init")
 
 
@@ -49,11 +53,13 @@ class InitDB(UseCase):
         self.db = db
 
     def execute(self) -> None:
-        data_model_table, datasets_table = DataModelTable(), DatasetsTable()
-        if not data_model_table.exists(self.db):
-            data_model_table.create(self.db)
-        if not datasets_table.exists(self.db):
-            datasets_table.create(self.db)
+        if not _DATA_MODEL_TABLE.exists(self.db):
+            _DATA_MODEL_TABLE.create(self.db)
+        if not _DATASETS_TABLE.exists(self.db):
+            _DATASETS_TABLE.create(self.db)
+        else:
+            # Databases created before an index was declared do not have it.
+            _DATASETS_TABLE.create_missing_indexes(self.db)
 
 
 class AddDataModel(UseCase):
@@ -65,25 +71,22 @@ class AddDataModel(UseCase):
     def execute(self, data_model_metadata) -> None:
         code, version = data_model_metadata["code"], data_model_metadata["version"]
         data_model = get_data_model_fullname(code, version)
-        cdes = flatten_cdes(copy.deepcopy(data_model_metadata))
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_next_data_model_id(self.sqlite_db)
+        cdes = flatten_cdes(data_model_metadata)
+        # The properties are built, and the longitudinal flag validated, before
+        # anything is created so that an invalid flag leaves nothing behind.
+        properties = Properties(None)
+        properties.add_property("cdes", data_model_metadata, True)
+        self._tag_longitudinal_if_needed(data_model_metadata, properties)
         self._create_primary_data_table(data_model, cdes)
         self._create_metadata_table(data_model, cdes)
-        properties = Properties(
-            data_model_table.get_data_model_properties(data_model_id, self.sqlite_db)
-        )
-        properties.add_property("cdes", data_model_metadata, True)
         values = dict(
-            data_model_id=data_model_id,
             code=code,
             version=version,
             label=data_model_metadata["label"],
             status="ENABLED",
             properties=properties.properties,
         )
-        data_model_table.insert_values(values, self.sqlite_db)
-        self._tag_longitudinal_if_needed(data_model_metadata, code, version)
+        _DATA_MODEL_TABLE.insert_values(values, self.sqlite_db)
 
     def _create_primary_data_table(self, data_model, cdes):
         with self.monetdb.begin() as conn:
@@ -97,7 +100,7 @@ class AddDataModel(UseCase):
         values = metadata_table.get_values_from_cdes(cdes)
         metadata_table.insert_values(values, self.sqlite_db)
 
-    def _tag_longitudinal_if_needed(self, data_model_metadata, code, version):
+    def _tag_longitudinal_if_needed(self, data_model_metadata, properties):
         if LONGITUDINAL in data_model_metadata:
             longitudinal = data_model_metadata[LONGITUDINAL]
             if not isinstance(longitudinal, bool):
@@ -105,9 +108,7 @@ class AddDataModel(UseCase):
                     f"Longitudinal flag should be boolean, value given: {longitudinal}"
                 )
             if longitudinal:
-                TagDataModel(self.sqlite_db).execute(
-                    code=code, version=version, tag=LONGITUDINAL
-                )
+                properties.add_tag(LONGITUDINAL)
 
 
 class ValidateDataModel(UseCase):
@@ -116,7 +117,7 @@ class ValidateDataModel(UseCase):
             raise UserInputError(
                 "You need to include a version on the CDEsMetadata.json"
             )
-        cdes = flatten_cdes(copy.deepcopy(data_model_metadata))
+        cdes = flatten_cdes(data_model_metadata)
         validate_dataset_present_on_cdes_with_proper_format(cdes)
         if LONGITUDINAL in data_model_metadata:
             longitudinal = data_model_metadata[LONGITUDINAL]
@@ -137,20 +138,20 @@ class DeleteDataModel(UseCase):
     def execute(self, code, version, force) -> None:
         name = get_data_model_fullname(code, version)
         schema = Schema(name)
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
+        data_model_id = _DATA_MODEL_TABLE.get_data_model_id(
             code, version, self.sqlite_db
         )
         if not force:
             self._validate_data_model_deletion(name, data_model_id)
-        MetadataTable(data_model=name).drop(self.sqlite_db)
-        self._delete_datasets(data_model_id, code, version)
+        # The primary data of the datasets are removed along with the schema.
         with self.monetdb.begin() as conn:
             schema.drop(conn)
-        data_model_table.delete_data_model(code, version, self.sqlite_db)
+        MetadataTable(data_model=name).drop(self.sqlite_db)
+        _DATASETS_TABLE.delete_datasets(data_model_id, self.sqlite_db)
+        _DATA_MODEL_TABLE.delete_data_model(code, version, self.sqlite_db)
 
     def _validate_data_model_deletion(self, data_model_name, data_model_id):
-        datasets = DatasetsTable().get_dataset_codes(
+        datasets = _DATASETS_TABLE.get_dataset_codes(
             db=self.sqlite_db, columns=["code"], data_model_id=data_model_id
         )
         if datasets:
@@ -158,18 +159,6 @@ class DeleteDataModel(UseCase):
                 f"The Data Model:{data_model_name} cannot be deleted because it contains Datasets: {datasets}\nIf you want to force delete everything, please use the '--force' flag"
             )
 
-    def _delete_datasets(self, data_model_id, data_model_code, data_model_version):
-        datasets_table = DatasetsTable()
-        dataset_codes = datasets_table.get_dataset_codes(
-            data_model_id=data_model_id, columns=["code"], db=self.sqlite_db
-        )
-        for dataset_code in dataset_codes:
-            DeleteDataset(sqlite_db=self.sqlite_db, monetdb=self.monetdb).execute(
-                dataset_code,
-                data_model_code=data_model_code,
-                data_model_version=data_model_version,
-            )
-
 
 class ImportCSV(UseCase):
     def __init__(self, sqlite_db: SQLiteDB, monetdb: MonetDB) -> None:
@@ -178,17 +167,17 @@ class ImportCSV(UseCase):
         is_db_initialized(sqlite_db)
 
     def execute(
-        self, csv_path, copy_from_file, data_model_code, data_model_version
+        self, csv_path, copy_from_file, data_model_code, data_model_version, cdes=None
     ) -> None:
         data_model_name = get_data_model_fullname(
             code=data_model_code, version=data_model_version
         )
         data_model = Schema(data_model_name)
-        data_model_id = DataModelTable().get_data_model_id(
+        data_model_id = _DATA_MODEL_TABLE.get_data_model_id(
             data_model_code, data_model_version, self.sqlite_db
         )
-        metadata_table = MetadataTable.from_db(data_model_name, self.sqlite_db)
-        cdes = metadata_table.table
+        if cdes is None:
+            cdes = MetadataTable.from_db(data_model_name, self.sqlite_db).table
         dataset_enumerations = get_dataset_enums(cdes)
         sql_type_per_column = get_sql_type_per_column(cdes)
 
@@ -201,25 +190,24 @@ class ImportCSV(UseCase):
                 else self._import_csv(csv_path, data_model, monetdb_conn)
             )
 
-        existing_datasets = DatasetsTable().get_dataset_codes(
-            columns=["code"], data_model_id=data_model_id, db=self.sqlite_db
-        )
-        dataset_id = self._get_next_dataset_id()
-        for dataset in set(imported_datasets) - set(existing_datasets):
-            values = dict(
-                data_model_id=data_model_id,
-                dataset_id=dataset_id,
-                code=dataset,
-                label=dataset_enumerations[dataset],
-                csv_path=csv_path if copy_from_file else None,
-                status="ENABLED",
-                properties=None,
-            )
-            DatasetsTable().insert_values(values, self.sqlite_db)
-            dataset_id += 1
-
-    def _get_next_dataset_id(self):
-        return DatasetsTable().get_next_dataset_id(self.sqlite_db)
+        if not imported_datasets:
+            return
+        existing_datasets = _DATASETS_TABLE.get_existing_dataset_codes(
+            data_model_id, imported_datasets, self.sqlite_db
+        )
+        new_datasets = imported_datasets.difference(existing_datasets)
+        common_values = {
+            "data_model_id": data_model_id,
+            "csv_path": csv_path if copy_from_file else None,
+            "status": "ENABLED",
+            "properties": None,
+        }
+        values = [
+            {**common_values, "code": dataset, "label": dataset_enumerations[dataset]}
+            for dataset in new_datasets
+        ]
+        if values:
+            _DATASETS_TABLE.insert_values(values, self.sqlite_db)
 
     def _create_temporary_table(self, dataframe_sql_type_per_column, db):
         temporary_table = TemporaryTable(dataframe_sql_type_per_column, db)
@@ -267,7 +255,7 @@ class ImportCSV(UseCase):
 
     def insert_csv_to_db(self, csv_path, temporary_table, data_model, db):
         primary_data_table = PrimaryDataTable.from_db(data_model, db)
-        offset, imported_datasets = 2, []
+        offset, imported_datasets = 2, set()
         while True:
             temporary_table.load_csv(
                 csv_path=csv_path, offset=offset, records=RECORDS_PER_COPY, db=db
@@ -276,7 +264,7 @@ class ImportCSV(UseCase):
             table_count = temporary_table.get_row_count(db=db)
             if not table_count:
                 break
-            imported_datasets = set(imported_datasets) | set(
+            imported_datasets.update(
                 temporary_table.get_column_distinct(DATASET_COLUMN_NAME, db)
             )
             db.copy_data_table_to_another_table(primary_data_table, temporary_table)
@@ -286,13 +274,13 @@ class ImportCSV(UseCase):
         return imported_datasets
 
     def _import_csv(self, csv_path, data_model, conn):
-        imported_datasets, primary_data_table = [], PrimaryDataTable.from_db(
+        imported_datasets, primary_data_table = set(), PrimaryDataTable.from_db(
             data_model, conn
         )
         with CSVDataFrameReader(csv_path).get_reader() as reader:
             for dataset_data in reader:
                 dataframe = DataFrame(dataset_data)
-                imported_datasets = set(imported_datasets) | set(dataframe.datasets)
+                imported_datasets.update(dataframe.datasets)
                 primary_data_table.insert_values(dataframe.to_dict(), conn)
         return imported_datasets
 
@@ -336,7 +324,7 @@ class ValidateDataset(UseCase):
 
     def execute(
         self, csv_path, copy_from_file, data_model_code, data_model_version
-    ) -> None:
+    ) -> dict:
         data_model = get_data_model_fullname(
             code=data_model_code, version=data_model_version
         )
@@ -370,12 +358,15 @@ class ValidateDataset(UseCase):
         self.verify_datasets_exist_in_enumerations(
             validated_datasets, dataset_enumerations
         )
+        # The CDEs are returned so that an import right after the validation
+        # can reuse them instead of reading the metadata table again.
+        return cdes
 
     def is_data_model_longitudinal(self, data_model_code, data_model_version):
-        data_model_id = DataModelTable().get_data_model_id(
+        data_model_id = _DATA_MODEL_TABLE.get_data_model_id(
             data_model_code, data_model_version, self.sqlite_db
         )
-        properties = DataModelTable().get_data_model_properties(
+        properties = _DATA_MODEL_TABLE.get_data_model_properties(
             data_model_id, self.sqlite_db
         )
         return LONGITUDINAL in properties["tags"]
@@ -383,7 +374,7 @@ class ValidateDataset(UseCase):
     def validate_csv(
         self, csv_path, sql_type_per_column, cdes_with_min_max, cdes_with_enumerations
     ):
-        imported_datasets = []
+        imported_datasets = set()
         csv_columns = pd.read_csv(csv_path, nrows=0).columns.tolist()
         dataframe_schema = DataFrameSchema(
             sql_type_per_column, cdes_with_min_max, cdes_with_enumerations, csv_columns
@@ -392,7 +383,7 @@ class ValidateDataset(UseCase):
             for dataset_data in reader:
                 dataframe = DataFrame(dataset_data)
                 dataframe_schema.validate_dataframe(dataframe.data)
-                imported_datasets = set(imported_datasets) | set(dataframe.datasets)
+                imported_datasets.update(dataframe.datasets)
         return imported_datasets
 
     def validate_csv_with_volume(
@@ -455,7 +446,7 @@ class ValidateDatasetNoDatabase(UseCase):
             raise InvalidDatasetError(
                 "The 'dataset' column is required to exist in the csv."
             )
-        cdes = flatten_cdes(copy.deepcopy(data_model_metadata))
+        cdes = flatten_cdes(data_model_metadata)
         cdes = {cde.code: cde for cde in cdes}
         sql_type_per_column = get_sql_type_per_column(cdes)
         cdes_with_min_max = get_cdes_with_min_max(cdes, csv_columns)
@@ -483,7 +474,7 @@ class ValidateDatasetNoDatabase(UseCase):
     def validate_csv(
         self, csv_path, sql_type_per_column, cdes_with_min_max, cdes_with_enumerations
     ):
-        imported_datasets = []
+        imported_datasets = set()
 
         csv_columns = pd.read_csv(csv_path, nrows=0).columns.tolist()
         dataframe_schema = DataFrameSchema(
@@ -493,7 +484,7 @@ class ValidateDatasetNoDatabase(UseCase):
             for dataset_data in reader:
                 dataframe = DataFrame(dataset_data)
                 dataframe_schema.validate_dataframe(dataframe.data)
-                imported_datasets = set(imported_datasets) | set(dataframe.datasets)
+                imported_datasets.update(dataframe.datasets)
         return imported_datasets
 
     def verify_datasets_exist_in_enumerations(self, datasets, dataset_enumerations):
@@ -516,82 +507,81 @@ class DeleteDataset(UseCase):
         data_model_fullname = get_data_model_fullname(
             code=data_model_code, version=data_model_version
         )
-        with self.monetdb.begin() as conn:
-            primary_data_table = PrimaryDataTable.from_db(
-                Schema(data_model_fullname), conn
-            )
-            primary_data_table.remove_dataset(dataset_code, data_model_fullname, conn)
-        data_model_id = DataModelTable().get_data_model_id(
-            data_model_code, data_model_version, self.sqlite_db
-        )
-        dataset_id = DatasetsTable().get_dataset_id(
-            dataset_code, data_model_id, self.sqlite_db
+        dataset_id, data_model_id = _DATASETS_TABLE.get_dataset_and_data_model_id(
+            dataset_code, data_model_code, data_model_version, self.sqlite_db
         )
-        DatasetsTable().delete_dataset(dataset_id, data_model_id, self.sqlite_db)
+        with self.monetdb.begin() as conn:
+            PrimaryDataTable().remove_dataset(dataset_code, data_model_fullname, conn)
+        _DATASETS_TABLE.delete_dataset(dataset_id, data_model_id, self.sqlite_db)
 
 
-class EnableDataModel(UseCase):
+class _SetDataModelStatus(UseCase):
+    status: str
+
     def __init__(self, db: SQLiteDB) -> None:
         self.db = db
 
     def execute(self, code, version) -> None:
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(code, version, self.db)
-        current_status = data_model_table.get_data_model_status(data_model_id, self.db)
-        if current_status != "ENABLED":
-            data_model_table.set_data_model_status("ENABLED", data_model_id, self.db)
-        else:
-            raise UserInputError("The data model was already enabled")
+        if not _DATA_MODEL_TABLE.try_set_data_model_status(
+            self.status, code, version, self.db
+        ):
+            raise UserInputError(f"The data model was already {self.status.lower()}")
 
 
-class DisableDataModel(UseCase):
-    def __init__(self, db: SQLiteDB) -> None:
-        self.db = db
+class EnableDataModel(_SetDataModelStatus):
+    status = "ENABLED"
+
+
+class DisableDataModel(_SetDataModelStatus):
+    status = "DISABLED"
 
-    def execute(self, code, version) -> None:
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(code, version, self.db)
-        current_status = data_model_table.get_data_model_status(data_model_id, self.db)
-        if current_status != "DISABLED":
-            data_model_table.set_data_model_status("DISABLED", data_model_id, self.db)
-        else:
-            raise UserInputError("The data model was already disabled")
 
+class _SetDatasetStatus(UseCase):
+    status: str
 
-class EnableDataset(UseCase):
     def __init__(self, db: SQLiteDB) -> None:
         self.db = db
 
     def execute(self, dataset_code, data_model_code, data_model_version) -> None:
-        datasets_table = DatasetsTable()
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
-            data_model_code, data_model_version, self.db
-        )
-        dataset_id = datasets_table.get_dataset_id(dataset_code, data_model_id, self.db)
-        current_status = datasets_table.get_dataset_status(dataset_id, self.db)
-        if current_status != "ENABLED":
-            datasets_table.set_dataset_status("ENABLED", dataset_id, self.db)
-        else:
-            raise UserInputError("The dataset was already enabled")
+        if not _DATASETS_TABLE.try_set_dataset_status(
+            self.status, dataset_code, data_model_code, data_model_version, self.db
+        ):
+            raise UserInputError(f"The dataset was already {self.status.lower()}")
 
 
-class DisableDataset(UseCase):
-    def __init__(self, db: SQLiteDB) -> None:
-        self.db = db
+class EnableDataset(_SetDatasetStatus):
+    status = "ENABLED"
+
+
+class DisableDataset(_SetDatasetStatus):
+    status = "DISABLED"
+
+
+def _apply_properties_update(update, *args):
+    def apply(current_properties):
+        properties = Properties(current_properties)
+        update(properties, *args)
+        return properties.properties
+
+    return apply
 
-    def execute(self, dataset_code, data_model_code, data_model_version) -> None:
-        datasets_table = DatasetsTable()
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
-            data_model_code, data_model_version, self.db
-        )
-        dataset_id = datasets_table.get_dataset_id(dataset_code, data_model_id, self.db)
-        current_status = datasets_table.get_dataset_status(dataset_id, self.db)
-        if current_status != "DISABLED":
-            datasets_table.set_dataset_status("DISABLED", dataset_id, self.db)
-        else:
-            raise UserInputError("The dataset was already disabled")
+
+def _update_data_model_properties(db, code, version, update, *args):
+    data_model_id = _DATA_MODEL_TABLE.get_data_model_id(code, version, db)
+    _DATA_MODEL_TABLE.update_data_model_properties(
+        data_model_id, _apply_properties_update(update, *args), db
+    )
+
+
+def _update_dataset_properties(
+    db, dataset_code, data_model_code, data_model_version, update, *args
+):
+    dataset_id, _ = _DATASETS_TABLE.get_dataset_and_data_model_id(
+        dataset_code, data_model_code, data_model_version, db
+    )
+    _DATASETS_TABLE.update_dataset_properties(
+        dataset_id, _apply_properties_update(update, *args), db
+    )
 
 
 class TagDataModel(UseCase):
@@ -599,15 +589,7 @@ class TagDataModel(UseCase):
         self.db = db
 
     def execute(self, code, version, tag) -> None:
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(code, version, self.db)
-        properties = Properties(
-            data_model_table.get_data_model_properties(data_model_id, self.db)
-        )
-        properties.add_tag(tag)
-        data_model_table.set_data_model_properties(
-            properties.properties, data_model_id, self.db
-        )
+        _update_data_model_properties(self.db, code, version, Properties.add_tag, tag)
 
 
 class UntagDataModel(UseCase):
@@ -615,14 +597,8 @@ class UntagDataModel(UseCase):
         self.db = db
 
     def execute(self, code, version, tag) -> None:
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(code, version, self.db)
-        properties = Properties(
-            data_model_table.get_data_model_properties(data_model_id, self.db)
-        )
-        properties.remove_tag(tag)
-        data_model_table.set_data_model_properties(
-            properties.properties, data_model_id, self.db
+        _update_data_model_properties(
+            self.db, code, version, Properties.remove_tag, tag
         )
 
 
@@ -631,14 +607,8 @@ class AddPropertyToDataModel(UseCase):
         self.db = db
 
     def execute(self, code, version, key, value, force) -> None:
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(code, version, self.db)
-        properties = Properties(
-            data_model_table.get_data_model_properties(data_model_id, self.db)
-        )
-        properties.add_property(key, value, force)
-        data_model_table.set_data_model_properties(
-            properties.properties, data_model_id, self.db
+        _update_data_model_properties(
+            self.db, code, version, Properties.add_property, key, value, force
         )
 
 
@@ -647,14 +617,8 @@ class RemovePropertyFromDataModel(UseCase):
         self.db = db
 
     def execute(self, code, version, key, value) -> None:
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(code, version, self.db)
-        properties = Properties(
-            data_model_table.get_data_model_properties(data_model_id, self.db)
-        )
-        properties.remove_property(key, value)
-        data_model_table.set_data_model_properties(
-            properties.properties, data_model_id, self.db
+        _update_data_model_properties(
+            self.db, code, version, Properties.remove_property, key, value
         )
 
 
@@ -663,18 +627,13 @@ class TagDataset(UseCase):
         self.db = db
 
     def execute(self, dataset_code, data_model_code, data_model_version, tag) -> None:
-        datasets_table = DatasetsTable()
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
-            data_model_code, data_model_version, self.db
-        )
-        dataset_id = datasets_table.get_dataset_id(dataset_code, data_model_id, self.db)
-        properties = Properties(
-            datasets_table.get_dataset_properties(data_model_id, self.db)
-        )
-        properties.add_tag(tag)
-        datasets_table.set_dataset_properties(
-            properties.properties, dataset_id, self.db
+        _update_dataset_properties(
+            self.db,
+            dataset_code,
+            data_model_code,
+            data_model_version,
+            Properties.add_tag,
+            tag,
         )
 
 
@@ -683,18 +642,8 @@ class UntagDataset(UseCase):
         self.db = db
 
     def execute(self, dataset, data_model_code, version, tag) -> None:
-        datasets_table = DatasetsTable()
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
-            data_model_code, version, self.db
-        )
-        dataset_id = datasets_table.get_dataset_id(dataset, data_model_id, self.db)
-        properties = Properties(
-            datasets_table.get_dataset_properties(data_model_id, self.db)
-        )
-        properties.remove_tag(tag)
-        datasets_table.set_dataset_properties(
-            properties.properties, dataset_id, self.db
+        _update_dataset_properties(
+            self.db, dataset, data_model_code, version, Properties.remove_tag, tag
         )
 
 
@@ -703,18 +652,15 @@ class AddPropertyToDataset(UseCase):
         self.db = db
 
     def execute(self, dataset, data_model_code, version, key, value, force) -> None:
-        datasets_table = DatasetsTable()
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
-            data_model_code, version, self.db
-        )
-        dataset_id = datasets_table.get_dataset_id(dataset, data_model_id, self.db)
-        properties = Properties(
-            datasets_table.get_dataset_properties(data_model_id, self.db)
-        )
-        properties.add_property(key, value, force)
-        datasets_table.set_dataset_properties(
-            properties.properties, dataset_id, self.db
+        _update_dataset_properties(
+            self.db,
+            dataset,
+            data_model_code,
+            version,
+            Properties.add_property,
+            key,
+            value,
+            force,
         )
 
 
@@ -723,18 +669,14 @@ class RemovePropertyFromDataset(UseCase):
         self.db = db
 
     def execute(self, dataset, data_model_code, version, key, value) -> None:
-        datasets_table = DatasetsTable()
-        data_model_table = DataModelTable()
-        data_model_id = data_model_table.get_data_model_id(
-            data_model_code, version, self.db
-        )
-        dataset_id = datasets_table.get_dataset_id(dataset, data_model_id, self.db)
-        properties = Properties(
-            datasets_table.get_dataset_properties(data_model_id, self.db)
-        )
-        properties.remove_property(key, value)
-        datasets_table.set_dataset_properties(
-            properties.properties, dataset_id, self.db
+        _update_dataset_properties(
+            self.db,
+            dataset,
+            data_model_code,
+            version,
+            Properties.remove_property,
+            key,
+            value,
         )
 
 
@@ -743,27 +685,24 @@ class ListDataModels(UseCase):
         self.db = db
 
     def execute(self) -> None:
-        data_model_table = DataModelTable()
         data_model_row_columns = ["data_model_id", "code", "version", "label", "status"]
-        data_model_rows = data_model_table.get_data_models(
+        data_model_rows = _DATA_MODEL_TABLE.get_data_models(
             db=self.db, columns=data_model_row_columns
         )
-        dataset_count_by_data_model_id = {
-            data_model_id: dataset_count
-            for data_model_id, dataset_count in data_model_table.get_dataset_count_by_data_model_id(
-                self.db
-            )
-        }
-        data_models_info = [
-            list(row) + [dataset_count_by_data_model_id.get(row[0], 0)]
-            for row in data_model_rows
-        ]
-
-        if not data_models_info:
+        if not data_model_rows:
             print("There are no data models.")
             return
 
-        df = pd.DataFrame(data_models_info, columns=data_model_row_columns + ["count"])
+        dataset_count_by_data_model_id = dict(
+            _DATA_MODEL_TABLE.get_dataset_count_by_data_model_id(self.db)
+        )
+        df = pd.DataFrame(data_model_rows, columns=data_model_row_columns)
+        df["count"] = (
+            df["data_model_id"]
+            .map(dataset_count_by_data_model_id)
+            .fillna(0)
+            .astype(int)
+        )
         print(df)
 
 
@@ -773,39 +712,33 @@ class ListDatasets(UseCase):
         self.monetdb = monetdb
 
     def execute(self) -> None:
-        data_model_table = DataModelTable()
-        dataset_table = DatasetsTable()
         dataset_row_columns = ["dataset_id", "data_model_id", "code", "label", "status"]
-        dataset_rows = dataset_table.get_datasets(
-            self.sqlite_db, columns=dataset_row_columns
+        dataset_rows = _DATASETS_TABLE.get_datasets_with_data_model_fullname(
+            self.sqlite_db
         )
-        data_model_fullname_by_data_model_id = {
-            data_model_id: get_data_model_fullname(code, version)
-            for data_model_id, code, version in data_model_table.get_data_models(
-                self.sqlite_db, ["data_model_id", "code", "version"]
-            )
-        }
-        datasets_info = []
-
-        for row in dataset_rows:
-            data_model_fullname = data_model_fullname_by_data_model_id[row[1]]
-            with self.monetdb.begin() as conn:
-                primary_data_table = PrimaryDataTable.from_db(
-                    Schema(data_model_fullname), conn
-                )
-                dataset_count = {
-                    dataset: count
-                    for dataset, count in primary_data_table.get_data_count_by_dataset(
-                        data_model_fullname, conn
-                    )
-                }.get(row[2], 0)
-                datasets_info.append(list(row) + [dataset_count])
-
-        if not datasets_info:
+        if not dataset_rows:
             print("There are no datasets.")
             return
 
-        df = pd.DataFrame(datasets_info, columns=dataset_row_columns + ["count"])
+        primary_data_table = PrimaryDataTable()
+        with self.monetdb.begin() as conn:
+            dataset_count_by_data_model = {
+                data_model_fullname: dict(
+                    primary_data_table.get_data_count_by_dataset(
+                        data_model_fullname, conn
+                    )
+                )
+                for data_model_fullname in {row[-1] for row in dataset_rows}
+            }
+        df = pd.DataFrame(
+            dataset_rows, columns=dataset_row_columns + ["data_model_fullname"]
+        )
+        df["count"] = [
+            dataset_count_by_data_model[data_model_fullname].get(code, 0)
+            for data_model_fullname, code in zip(
+                df.pop("data_model_fullname"), df["code"]
+            )
+        ]
         print(df)
 
 
@@ -815,15 +748,24 @@ class Cleanup(UseCase):
         self.monetdb = monetdb
 
     def execute(self) -> None:
-        data_model_table = DataModelTable()
-        data_model_rows = data_model_table.get_data_models(
+        data_model_rows = _DATA_MODEL_TABLE.get_data_models(
             self.sqlite_db, columns=["code", "version"]
         )
+        data_model_names = [
+            get_data_model_fullname(code, version) for code, version in data_model_rows
+        ]
+        if not data_model_names:
+            return
 
-        for code, version in data_model_rows:
-            DeleteDataModel(sqlite_db=self.sqlite_db, monetdb=self.monetdb).execute(
-                code=code, version=version, force=True
-            )
+        # Everything is removed, so instead of deleting the data models one by one
+        # all the schemas are dropped together and the registry is emptied.
+        with self.monetdb.begin() as conn:
+            for name in data_model_names:
+                Schema(name).drop(conn)
+        for name in data_model_names:
+            MetadataTable(data_model=name).drop(self.sqlite_db)
+        _DATASETS_TABLE.delete(self.sqlite_db)
+        _DATA_MODEL_TABLE.delete(self.sqlite_db)
 
 
 def get_data_model_fullname(code, version):
@@ -44,7 +44,7 @@ MONETDB_OPTIONS = [
 ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_model_metadata():
     reader = JsonFileReader(DATA_MODEL_FILE)
     return reader.read()
@@ -79,15 +79,17 @@ def monetdb_container():
         )
     # The time needed to start a monetdb container varies considerably. We need
     # to wait until some phrases appear in the logs to avoid starting the tests
-    # too soon. The process is abandoned after 100 tries (50 sec).
-    for _ in range(100):
-        if b"new database mapi:monetdb" in container.logs():
-            break
-        time.sleep(0.5)
-    else:
-        raise MonetDBSetupError
+    # too soon. The logs are polled with a growing delay, so that a container
+    # that is already up is not held back, and the process is abandoned after
+    # 50 sec.
+    deadline = time.monotonic() + 50
+    delay = 0.1
+    while b"new database mapi:monetdb" not in container.logs():
+        if time.monotonic() > deadline:
+            raise MonetDBSetupError
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
     yield
-    container = client.containers.get("mipdb-testing")
     container.remove(v=True, force=True)
 
 
@@ -96,7 +98,7 @@ def sqlite_db():
     return SQLiteDB.from_config({"db_path": SQLiteDB_PATH})
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def monetdb():
     dbconfig = get_monetdb_config(IP, PORT, USERNAME, PASSWORD, DB_NAME)
     return MonetDB.from_config(dbconfig)
@@ -231,3 +231,70 @@ def test_get_dataset_id_not_found_error(sqlite_db):
     # Test when there is no dataset in the database with the specific code and data_model_id
     with pytest.raises(DataBaseError):
         dataset_id = sqlite_db.get_dataset_id("dataset", 1)
+
+
+@pytest.mark.database
+@pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+def test_get_dataset_and_data_model_id_with_db(sqlite_db):
+    # Setup
+    runner = CliRunner()
+    runner.invoke(init, SQLiteDB_OPTION)
+    runner.invoke(add_data_model, [DATA_MODEL_FILE] + SQLiteDB_OPTION + MONETDB_OPTIONS)
+    runner.invoke(
+        add_dataset,
+        [
+            DATASET_FILE,
+            "-d",
+            "data_model",
+            "-v",
+            "1.0",
+            "--copy_from_file",
+            False,
+        ]
+        + SQLiteDB_OPTION
+        + MONETDB_OPTIONS,
+    )
+
+    # Test
+    ids = sqlite_db.get_dataset_and_data_model_id("dataset", "data_model", "1.0")
+    assert ids == (1, 1)
+
+
+@pytest.mark.database
+@pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+def test_get_existing_dataset_codes(sqlite_db):
+    # Setup
+    runner = CliRunner()
+    runner.invoke(init, SQLiteDB_OPTION)
+    runner.invoke(add_data_model, [DATA_MODEL_FILE] + SQLiteDB_OPTION + MONETDB_OPTIONS)
+    runner.invoke(
+        add_dataset,
+        [
+            DATASET_FILE,
+            "-d",
+            "data_model",
+            "-v",
+            "1.0",
+            "--copy_from_file",
+            False,
+        ]
+        + SQLiteDB_OPTION
+        + MONETDB_OPTIONS,
+    )
+
+    # Test
+    codes = sqlite_db.get_existing_dataset_codes(1, {"dataset", "dataset1"})
+    assert codes == {"dataset"}
+
+
+@pytest.mark.database
+@pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+def test_get_dataset_and_data_model_id_not_found_error(sqlite_db):
+    # Setup
+    runner = CliRunner()
+    runner.invoke(init, SQLiteDB_OPTION)
+    runner.invoke(add_data_model, [DATA_MODEL_FILE] + SQLiteDB_OPTION + MONETDB_OPTIONS)
+
+    # Test when there is no dataset in the database with the specific code and data model
+    with pytest.raises(DataBaseError):
+        sqlite_db.get_dataset_and_data_model_id("dataset", "data_model", "1.0")
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from mipdb.dataelements import (
@@ -40,6 +42,22 @@ def test_make_cdes(data_model_metadata):
     assert len(cdes) == 6
 
 
+def test_make_cdes_leaves_metadata_unchanged(data_model_metadata):
+    original = copy.deepcopy(data_model_metadata)
+    flatten_cdes(data_model_metadata)
+    assert data_model_metadata == original
+
+
+def test_cde_metadata_dict_is_parsed_once():
+    cde = CommonDataElement(
+        code="dataset",
+        metadata='{"code": "dataset", "sql_type": "text", "enumerations": {"dataset": "Dataset"}, "is_categorical": true}',
+    )
+    assert cde.metadata_dict["sql_type"] == "text"
+    assert cde.metadata_dict is cde.metadata_dict
+    assert cde.get_enumerations() == {"dataset": "Dataset"}
+
+
 def test_validate_dataset_present_on_cdes_with_proper_format(data_model_metadata):
     cdes = flatten_cdes(data_model_metadata)
     validate_dataset_present_on_cdes_with_proper_format(cdes)
@@ -83,6 +83,22 @@ class TestVariablesMetadataTable:
             isinstance(cde, CommonDataElement) for cde in metadata_table.table.values()
         )
 
+    @pytest.mark.database
+    @pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+    def test_load_from_db_after_insert(self, data_model_metadata, sqlite_db):
+        # Setup
+
+        data_model = "data_model:1.0"
+        metadata_table = MetadataTable(data_model)
+        metadata_table.create(sqlite_db)
+        assert MetadataTable.from_db(data_model, sqlite_db).table == {}
+        values = metadata_table.get_values_from_cdes(flatten_cdes(data_model_metadata))
+        metadata_table.insert_values(values, sqlite_db)
+        # Test
+
+        metadata_table = MetadataTable.from_db(data_model, sqlite_db)
+        assert len(metadata_table.table) == 6
+
 
 class TestPrimaryDataTable:
     @pytest.mark.database
@@ -33,6 +33,7 @@ from mipdb.usecases import UntagDataModel
 from mipdb.usecases import ValidateDataset
 from mipdb.usecases import is_db_initialized
 from tests.conftest import DATASET_FILE, ABSOLUTE_PATH_DATASET_FILE
+from tests.conftest import ABSOLUTE_PATH_DATASET_FILE_MULTIPLE_DATASET
 
 
 # NOTE Some use cases have a main responsibility (e.g. add a new data_model) which
@@ -155,6 +156,20 @@ def test_re_init_with_missing_datasets_table_with_db(sqlite_db):
     assert datasets_table.exists(sqlite_db)
 
 
+@pytest.mark.database
+@pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+def test_re_init_creates_missing_datasets_index_with_db(sqlite_db):
+    # Setup
+    InitDB(sqlite_db).execute()
+    sqlite_db.execute("DROP INDEX ix_datasets_data_model_id_code")
+    InitDB(sqlite_db).execute()
+
+    # Test
+
+    indexes = sqlite_db.execute_fetchall("PRAGMA index_list('datasets')")
+    assert "ix_datasets_data_model_id_code" in [index[1] for index in indexes]
+
+
 @pytest.mark.database
 @pytest.mark.usefixtures("monetdb_container", "cleanup_db")
 def test_add_data_model_with_db(sqlite_db, monetdb, data_model_metadata):
@@ -165,6 +180,22 @@ def test_add_data_model_with_db(sqlite_db, monetdb, data_model_metadata):
     )
 
 
+@pytest.mark.database
+@pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+def test_add_data_model_invalid_longitudinal_flag(
+    sqlite_db, monetdb, data_model_metadata
+):
+    # Setup
+    InitDB(sqlite_db).execute()
+    data_model_metadata = {**data_model_metadata, "longitudinal": "yes"}
+
+    # Test
+    with pytest.raises(UserInputError):
+        AddDataModel(sqlite_db, monetdb).execute(data_model_metadata)
+    assert sorted(sqlite_db.get_all_tables()) == ["data_models", "datasets"]
+    assert "data_model:1.0" not in monetdb.get_schemas()
+
+
 @pytest.mark.database
 @pytest.mark.usefixtures("monetdb_container", "cleanup_db")
 def test_delete_data_model_with_db(sqlite_db, monetdb, data_model_metadata):
@@ -735,6 +766,41 @@ def test_tag_dataset_with_db(sqlite_db, monetdb, data_model_metadata):
     assert properties == {"tags": ["tag"], "properties": {}}
 
 
+@pytest.mark.database
+@pytest.mark.usefixtures("monetdb_container", "cleanup_db")
+def test_tag_dataset_with_id_other_than_data_model_id(
+    sqlite_db, monetdb, data_model_metadata
+):
+    # Setup
+    InitDB(sqlite_db).execute()
+    AddDataModel(sqlite_db, monetdb).execute(data_model_metadata)
+    ImportCSV(sqlite_db, monetdb).execute(
+        ABSOLUTE_PATH_DATASET_FILE_MULTIPLE_DATASET, False, "data_model", "1.0"
+    )
+    data_model_id = sqlite_db.get_data_model_id("data_model", "1.0")
+    dataset_id_by_code = {
+        code: sqlite_db.get_dataset_id(code, data_model_id)
+        for code in ["dataset", "dataset1", "dataset2"]
+    }
+    dataset_code, dataset_id = next(
+        (code, dataset_id)
+        for code, dataset_id in dataset_id_by_code.items()
+        if dataset_id != data_model_id
+    )
+
+    # Test
+    TagDataset(sqlite_db).execute(
+        dataset_code=dataset_code,
+        data_model_code=data_model_metadata["code"],
+        data_model_version=data_model_metadata["version"],
+        tag="tag",
+    )
+
+    properties = sqlite_db.get_dataset_properties(dataset_id)
+    assert properties == {"tags": ["tag"], "properties": {}}
+    assert not sqlite_db.get_dataset_properties(data_model_id)
+
+
 @pytest.mark.database
 @pytest.mark.usefixtures("monetdb_container", "cleanup_db")
 def test_untag_dataset_with_db(sqlite_db, monetdb, data_model_metadata):